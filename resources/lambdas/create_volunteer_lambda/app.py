@@ -1,7 +1,9 @@
 import json
+import math
 import os
 import uuid
 from datetime import datetime, timezone
+from decimal import Decimal
 
 import boto3
 
@@ -19,6 +21,66 @@ def get_table():
     return dynamo.Table(table_name)
 
 
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Full-precision geohash (~5 m cells) is the GSI sort key; the 4-char prefix (~39 x 20 km)
+# is the GSI partition key, so nearby queries can use begins_with() on any finer cell.
+GEOHASH_PRECISION = 9
+GEOHASH_PARTITION_PRECISION = 4
+
+
+def geohash_encode(lat, lon, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # geohash interleaves bits starting with longitude
+
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def parse_location(body):
+    """
+    Optional lat/lon. Returns (lat, lon), None when both are absent,
+    or raises ValueError with a client-facing message.
+    """
+    lat, lon = body.get("lat"), body.get("lon")
+    if lat is None and lon is None:
+        return None
+    if lat is None or lon is None:
+        raise ValueError("lat and lon must be provided together")
+    if isinstance(lat, bool) or isinstance(lon, bool):
+        raise ValueError("lat and lon must be numbers")
+
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        raise ValueError("lat and lon must be numbers")
+
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        raise ValueError("lat and lon must be numbers")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("lat must be within [-90, 90] and lon within [-180, 180]")
+    return lat, lon
+
+
 def lambda_handler(event, context):
     table = get_table()
 
@@ -30,8 +92,14 @@ def lambda_handler(event, context):
             "body": json.dumps({"message": "name and email are required"})
         }
 
+    try:
+        location = parse_location(body)
+    except ValueError as e:
+        return {"statusCode": 400, "body": json.dumps({"message": str(e)})}
+
     # ✅ One canonical id (matches DynamoDB partition key "id")
     volunteer_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc).isoformat()
 
     item = {
         "id": volunteer_id,  # ✅ REQUIRED key for DynamoDB table
@@ -44,9 +112,21 @@ def lambda_handler(event, context):
         "availability": body.get("availability", ""),
         "preferred_contact_method": body.get("preferred_contact_method", "email"),
         "is_active": True,
-        "createdAt": datetime.now(timezone.utc).isoformat(),  # keep camelCase consistent
+        "createdAt": now,  # keep camelCase consistent
+        # version/updatedAt drive the ETag on the read lambdas; bump both on every write
+        "version": 1,
+        "updatedAt": now,
     }
 
+    if location:
+        lat, lon = location
+        geohash = geohash_encode(lat, lon)
+        # DynamoDB numbers must be Decimal; 6 dp is ~10 cm
+        item["lat"] = Decimal(str(round(lat, 6)))
+        item["lon"] = Decimal(str(round(lon, 6)))
+        item["geohash"] = geohash
+        item["geohash4"] = geohash[:GEOHASH_PARTITION_PRECISION]
+
     table.put_item(Item=item)
 
     return {
@@ -1,15 +1,74 @@
+import hashlib
 import json
 import os
+from decimal import Decimal
+
 import boto3
 
 dynamo = boto3.resource("dynamodb")
 
+DEFAULT_CACHE_CONTROL = "private, max-age=60, stale-while-revalidate=300"
+
 
 def get_table():
     table_name = os.environ.get("VOLUNTEER_TABLE", "handsin-volunteers-dev")
     return dynamo.Table(table_name)
 
 
+def _cache_control():
+    """
+    Read Cache-Control at runtime so each route can tune max-age / stale-while-revalidate
+    via its own CACHE_CONTROL env var.
+    """
+    return os.environ.get("CACHE_CONTROL", DEFAULT_CACHE_CONTROL)
+
+
+def _json_default(value):
+    # DynamoDB hands numbers back as Decimal (e.g. "version")
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def compute_etag(item):
+    """
+    Strong ETag derived from the write-maintained version/updatedAt attributes,
+    so it can be computed without serializing the item.
+    Older records without those attributes fall back to createdAt.
+    """
+    version = item.get("version", 0)
+    stamp = item.get("updatedAt") or item.get("createdAt") or ""
+    digest = hashlib.sha256(f"{item['id']}:{version}:{stamp}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _if_none_match(event):
+    # HTTP API lowercases header names, REST API keeps the client's casing
+    headers = event.get("headers") or {}
+    for key, value in headers.items():
+        if key.lower() == "if-none-match":
+            return value
+    return None
+
+
+def etag_matches(if_none_match, etag):
+    """
+    If-None-Match uses the weak comparison function (RFC 9110 13.1.2),
+    so a W/ prefix from an intermediary still matches.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
 def lambda_handler(event, context):
     table = get_table()
 
@@ -31,7 +90,15 @@ def lambda_handler(event, context):
             "body": json.dumps({"message": "Volunteer not found"})
         }
 
+    etag = compute_etag(item)
+    headers = {"ETag": etag, "Cache-Control": _cache_control()}
+
+    if etag_matches(_if_none_match(event), etag):
+        return {"statusCode": 304, "headers": headers, "body": ""}
+
+    headers["Content-Type"] = "application/json"
     return {
         "statusCode": 200,
-        "body": json.dumps(item)
+        "headers": headers,
+        "body": json.dumps(item, default=_json_default)
     }
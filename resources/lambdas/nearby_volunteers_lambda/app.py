@@ -0,0 +1,221 @@
+import json
+import math
+import os
+from decimal import Decimal
+
+import boto3
+import numpy as np
+from boto3.dynamodb.conditions import Key
+
+dynamo = boto3.resource("dynamodb")
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Must match create_volunteer_lambda: full geohash is the GSI sort key,
+# its 4-char prefix the GSI partition key.
+GEOHASH_PRECISION = 9
+GEOHASH_PARTITION_PRECISION = 4
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Widen the search box slightly so float rounding never drops a point that
+# the haversine filter would accept.
+COVER_MARGIN = 1.001
+
+DEFAULT_RADIUS_KM = 10.0
+MAX_RADIUS_KM = 50.0
+
+# Pick the finest geohash precision whose cover stays within this many cells;
+# finer cells read fewer out-of-radius items, but each cell costs one Query.
+MAX_COVER_CELLS = 24
+
+# Hard cap on GSI queries per request. Near the poles even precision-4 cells get so
+# narrow that a small circle needs hundreds of them; reject those searches instead.
+MAX_QUERY_CELLS = 64
+
+
+def get_table():
+    table_name = os.environ.get("VOLUNTEER_TABLE", "handsin-volunteers-dev")
+    return dynamo.Table(table_name)
+
+
+def get_index_name():
+    return os.environ.get("GEOHASH_INDEX", "geohash4-index")
+
+
+def _json_default(value):
+    # DynamoDB hands numbers back as Decimal (version, lat, lon)
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def geohash_encode(lat, lon, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # geohash interleaves bits starting with longitude
+
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def _cell_size(precision):
+    """(height, width) of a geohash cell in degrees."""
+    total_bits = 5 * precision
+    lat_bits = total_bits // 2
+    lon_bits = total_bits - lat_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def covering_cells(lat, lon, radius_km):
+    """
+    Geohash cells that together cover the bounding box of the search circle.
+    Never coarser than the GSI partition precision, so every cell maps to one Query.
+    Raises ValueError when the cover would need more than MAX_QUERY_CELLS queries.
+    """
+    # Same sphere as the haversine filter, so the box always contains the circle
+    angular = radius_km / EARTH_RADIUS_KM * COVER_MARGIN
+    dlat = math.degrees(angular)
+    min_lat = max(lat - dlat, -90.0)
+    max_lat = min(lat + dlat, 90.0)
+
+    # Exact longitude half-width of a spherical cap; a cap over a pole spans every longitude
+    if abs(lat) + dlat >= 90.0:
+        full_lon = True
+    else:
+        dlon = math.degrees(math.asin(min(math.sin(angular) / math.cos(math.radians(lat)), 1.0)))
+        full_lon = dlon >= 180.0
+
+    for precision in range(GEOHASH_PRECISION, GEOHASH_PARTITION_PRECISION - 1, -1):
+        height, width = _cell_size(precision)
+        n_lat = round(180.0 / height)
+        n_lon = round(360.0 / width)
+
+        lat_first = min(int((min_lat + 90.0) // height), n_lat - 1)
+        lat_last = min(int((max_lat + 90.0) // height), n_lat - 1)
+        if full_lon:
+            lon_indexes = range(n_lon)
+        else:
+            lon_first = int((lon - dlon + 180.0) // width)
+            lon_last = int((lon + dlon + 180.0) // width)
+            lon_indexes = range(lon_first, lon_last + 1)
+
+        count = (lat_last - lat_first + 1) * len(lon_indexes)
+        if count <= MAX_COVER_CELLS or precision == GEOHASH_PARTITION_PRECISION:
+            break
+
+    if count > MAX_QUERY_CELLS:
+        raise ValueError("search area is too large; reduce radius_km or search further from the poles")
+
+    cells = set()
+    for i in range(lat_first, lat_last + 1):
+        center_lat = -90.0 + (i + 0.5) * height
+        for j in lon_indexes:
+            # wrap across the antimeridian
+            center_lon = -180.0 + ((j % n_lon) + 0.5) * width
+            cells.add(geohash_encode(center_lat, center_lon, precision))
+    return sorted(cells)
+
+
+def query_candidates(table, cells):
+    """Query the geohash GSI once per cell (paginated) and return every item found."""
+    index_name = get_index_name()
+    items = []
+    for cell in cells:
+        condition = Key("geohash4").eq(cell[:GEOHASH_PARTITION_PRECISION])
+        if len(cell) > GEOHASH_PARTITION_PRECISION:
+            condition = condition & Key("geohash").begins_with(cell)
+
+        kwargs = {"IndexName": index_name, "KeyConditionExpression": condition}
+        while True:
+            resp = table.query(**kwargs)
+            items.extend(resp.get("Items", []))
+            if "LastEvaluatedKey" not in resp:
+                break
+            kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+    return items
+
+
+def filter_by_distance(items, lat, lon, radius_km):
+    """
+    Exact haversine filter over all candidates at once.
+    Returns (item, distance_km) pairs within radius, nearest first.
+    """
+    if not items:
+        return []
+
+    lats = np.radians(np.fromiter((float(i["lat"]) for i in items), dtype=np.float64, count=len(items)))
+    lons = np.radians(np.fromiter((float(i["lon"]) for i in items), dtype=np.float64, count=len(items)))
+    lat0, lon0 = math.radians(lat), math.radians(lon)
+
+    a = (
+        np.sin((lats - lat0) / 2) ** 2
+        + math.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+    )
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    within = np.flatnonzero(distances <= radius_km)
+    order = within[np.argsort(distances[within], kind="stable")]
+    return [(items[k], float(distances[k])) for k in order]
+
+
+def parse_query(params):
+    """Returns (lat, lon, radius_km) or raises ValueError with a client-facing message."""
+    if params.get("lat") is None or params.get("lon") is None:
+        raise ValueError("lat and lon are required")
+
+    try:
+        lat = float(params["lat"])
+        lon = float(params["lon"])
+        radius_km = float(params.get("radius_km") or DEFAULT_RADIUS_KM)
+    except (TypeError, ValueError):
+        raise ValueError("lat, lon and radius_km must be numbers")
+
+    if not all(math.isfinite(v) for v in (lat, lon, radius_km)):
+        raise ValueError("lat, lon and radius_km must be numbers")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("lat must be within [-90, 90] and lon within [-180, 180]")
+    if not (0 < radius_km <= MAX_RADIUS_KM):
+        raise ValueError(f"radius_km must be greater than 0 and at most {MAX_RADIUS_KM:g}")
+    return lat, lon, radius_km
+
+
+def lambda_handler(event, context):
+    table = get_table()
+
+    params = event.get("queryStringParameters") or {}
+    try:
+        lat, lon, radius_km = parse_query(params)
+        cells = covering_cells(lat, lon, radius_km)
+    except ValueError as e:
+        return {"statusCode": 400, "body": json.dumps({"message": str(e)})}
+
+    candidates = query_candidates(table, cells)
+    matches = filter_by_distance(candidates, lat, lon, radius_km)
+
+    results = []
+    for item, distance in matches:
+        results.append({**item, "distance_km": round(distance, 3)})
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps(results, default=_json_default)
+    }
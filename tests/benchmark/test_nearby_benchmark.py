@@ -0,0 +1,111 @@
+"""
+Geohash GSI query vs full-table scan for "volunteers near me", on a synthetic dataset in Moto.
+
+Skipped unless RUN_BENCHMARKS is set (loading 500k items into Moto takes a few minutes):
+
+    RUN_BENCHMARKS=1 pytest tests/benchmark -s
+    RUN_BENCHMARKS=1 BENCH_VOLUNTEERS=50000 pytest tests/benchmark -s
+
+Moto evaluates GSI queries by walking the whole table, so wall time here understates
+the gain on real DynamoDB; items read (what DynamoDB bills for) is the fairer comparison.
+"""
+import os
+import random
+import time
+from decimal import Decimal
+
+import pytest
+from moto import mock_aws
+
+from resources.lambdas.nearby_volunteers_lambda.app import (
+    covering_cells,
+    filter_by_distance,
+    geohash_encode,
+    query_candidates,
+)
+from tests.volunteer_tables import TABLE_NAME, setup_geo_dynamodb
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="RUN_BENCHMARKS not set",
+)
+
+VOLUNTEER_COUNT = int(os.environ.get("BENCH_VOLUNTEERS", "500000"))
+
+# Volunteers spread around a handful of US metros, ~50 km jitter each
+METROS = [
+    (40.7128, -74.0060),   # New York
+    (34.0522, -118.2437),  # Los Angeles
+    (41.8781, -87.6298),   # Chicago
+    (29.7604, -95.3698),   # Houston
+    (33.4484, -112.0740),  # Phoenix
+    (39.9526, -75.1652),   # Philadelphia
+    (47.6062, -122.3321),  # Seattle
+    (25.7617, -80.1918),   # Miami
+]
+QUERY = (40.6928, -73.9903, 10.0)  # food bank in Brooklyn, 10 km
+
+
+def load_volunteers(table, count):
+    rng = random.Random(42)
+    with table.batch_writer() as batch:
+        for n in range(count):
+            metro_lat, metro_lon = rng.choice(METROS)
+            lat = round(metro_lat + rng.uniform(-0.45, 0.45), 6)
+            lon = round(metro_lon + rng.uniform(-0.6, 0.6), 6)
+            geohash = geohash_encode(lat, lon)
+            batch.put_item(
+                Item={
+                    "id": f"VOL{n:07d}",
+                    "name": f"Volunteer {n}",
+                    "email": f"volunteer{n}@example.com",
+                    "lat": Decimal(str(lat)),
+                    "lon": Decimal(str(lon)),
+                    "geohash": geohash,
+                    "geohash4": geohash[:4],
+                }
+            )
+
+
+def scan_all(table):
+    items = []
+    kwargs = {}
+    while True:
+        resp = table.scan(**kwargs)
+        items.extend(resp.get("Items", []))
+        if "LastEvaluatedKey" not in resp:
+            return items
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+
+@mock_aws
+def test_geohash_query_vs_scan(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    table = setup_geo_dynamodb()
+
+    started = time.perf_counter()
+    load_volunteers(table, VOLUNTEER_COUNT)
+    load_seconds = time.perf_counter() - started
+
+    lat, lon, radius_km = QUERY
+
+    started = time.perf_counter()
+    scanned = scan_all(table)
+    scan_matches = filter_by_distance(scanned, lat, lon, radius_km)
+    scan_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cells = covering_cells(lat, lon, radius_km)
+    candidates = query_candidates(table, cells)
+    geo_matches = filter_by_distance(candidates, lat, lon, radius_km)
+    geo_seconds = time.perf_counter() - started
+
+    print(
+        f"\n{VOLUNTEER_COUNT} volunteers (loaded in {load_seconds:.1f}s), "
+        f"{len(scan_matches)} within {radius_km:g} km"
+        f"\n  scan:    {len(scanned):>8} items read  {scan_seconds:8.2f}s"
+        f"\n  geohash: {len(candidates):>8} items read  {geo_seconds:8.2f}s  ({len(cells)} cells)"
+    )
+
+    assert [item["id"] for item, _ in geo_matches] == [item["id"] for item, _ in scan_matches]
+    assert len(candidates) < len(scanned)
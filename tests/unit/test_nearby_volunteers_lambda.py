@@ -0,0 +1,183 @@
+import json
+import math
+
+import pytest
+from moto import mock_aws
+
+from resources.lambdas.create_volunteer_lambda.app import lambda_handler as create_volunteer
+from resources.lambdas.nearby_volunteers_lambda.app import (
+    EARTH_RADIUS_KM,
+    MAX_QUERY_CELLS,
+    covering_cells,
+    filter_by_distance,
+    geohash_encode,
+    lambda_handler as nearby_volunteers,
+)
+from tests.volunteer_tables import TABLE_NAME, setup_geo_dynamodb
+
+# Food bank in downtown Brooklyn
+FOOD_BANK = (40.6928, -73.9903)
+
+
+def create(name, lat=None, lon=None):
+    payload = {"name": name, "email": f"{name.lower()}@example.com"}
+    if lat is not None:
+        payload["lat"] = lat
+        payload["lon"] = lon
+    resp = create_volunteer({"body": json.dumps(payload)}, None)
+    assert resp["statusCode"] == 201
+    return json.loads(resp["body"])["id"]
+
+
+def test_geohash_encode_known_value():
+    # Reference value from the original geohash.org examples
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_covering_cells_contain_circle_edges():
+    lat, lon = FOOD_BANK
+    radius_km = 10
+    cells = covering_cells(lat, lon, radius_km)
+    assert 0 < len(cells) <= 24
+
+    # Points at 99.9% of the radius due N/S/E/W (exact on the haversine sphere)
+    angular = 0.999 * radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    dlon = math.degrees(math.asin(math.sin(angular) / math.cos(math.radians(lat))))
+    for point_lat, point_lon in [(lat + dlat, lon), (lat - dlat, lon), (lat, lon + dlon), (lat, lon - dlon)]:
+        point = geohash_encode(point_lat, point_lon)
+        assert any(point.startswith(cell) for cell in cells)
+
+
+def test_covering_cells_wrap_antimeridian():
+    cells = covering_cells(0.0, 179.99, 5)
+    west = geohash_encode(0.0, -179.99)
+    assert any(west.startswith(cell) for cell in cells)
+
+
+def test_covering_cells_capped_near_poles():
+    assert len(covering_cells(70.0, 0.0, 50)) <= MAX_QUERY_CELLS
+    for lat, radius_km in [(89.9, 50), (89.0, 50), (-89.99, 1)]:
+        with pytest.raises(ValueError, match="search area is too large"):
+            covering_cells(lat, 0.0, radius_km)
+
+
+def test_filter_by_distance_sorts_and_excludes():
+    items = [
+        {"id": "far", "lat": 41.5, "lon": -73.99},
+        {"id": "near", "lat": 40.70, "lon": -73.99},
+        {"id": "here", "lat": FOOD_BANK[0], "lon": FOOD_BANK[1]},
+    ]
+    matches = filter_by_distance(items, *FOOD_BANK, 10)
+    assert [item["id"] for item, _ in matches] == ["here", "near"]
+    assert matches[0][1] == 0
+    assert 0.7 < matches[1][1] < 0.9
+
+
+@mock_aws
+def test_create_volunteer_stores_geohash(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    table = setup_geo_dynamodb()
+
+    volunteer_id = create("Nia", *FOOD_BANK)
+    stored = table.get_item(Key={"id": volunteer_id})["Item"]
+
+    assert float(stored["lat"]) == FOOD_BANK[0]
+    assert float(stored["lon"]) == FOOD_BANK[1]
+    assert stored["geohash"] == geohash_encode(*FOOD_BANK)
+    assert stored["geohash4"] == stored["geohash"][:4]
+
+    # Without a location the item stays out of the sparse index
+    plain = table.get_item(Key={"id": create("Omar")})["Item"]
+    assert "geohash" not in plain and "geohash4" not in plain
+
+
+@mock_aws
+def test_create_volunteer_location_validation(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    setup_geo_dynamodb()
+
+    cases = [
+        ({"lat": 40.7}, "lat and lon must be provided together"),
+        ({"lat": "north", "lon": -73.9}, "lat and lon must be numbers"),
+        ({"lat": True, "lon": -73.9}, "lat and lon must be numbers"),
+        ({"lat": 91, "lon": -73.9}, "lat must be within"),
+    ]
+    for location, message in cases:
+        payload = {"name": "X", "email": "x@example.com", **location}
+        resp = create_volunteer({"body": json.dumps(payload)}, None)
+        assert resp["statusCode"] == 400
+        assert message in json.loads(resp["body"])["message"]
+
+
+@mock_aws
+def test_nearby_volunteers_returns_within_radius(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    setup_geo_dynamodb()
+
+    create("Brooklyn", 40.6782, -73.9442)   # ~4.4 km
+    create("Manhattan", 40.7580, -73.9855)  # ~7.3 km
+    create("Newark", 40.7357, -74.1724)     # ~16 km
+    create("Boston", 42.3601, -71.0589)     # ~300 km
+    create("NoLocation")
+
+    event = {"queryStringParameters": {"lat": str(FOOD_BANK[0]), "lon": str(FOOD_BANK[1]), "radius_km": "10"}}
+    resp = nearby_volunteers(event, None)
+    assert resp["statusCode"] == 200
+
+    results = json.loads(resp["body"])
+    assert [v["name"] for v in results] == ["Brooklyn", "Manhattan"]
+    assert all(v["distance_km"] <= 10 for v in results)
+    assert results[0]["distance_km"] < results[1]["distance_km"]
+
+    # Widen the radius to pick up Newark
+    event["queryStringParameters"]["radius_km"] = "20"
+    results = json.loads(nearby_volunteers(event, None)["body"])
+    assert [v["name"] for v in results] == ["Brooklyn", "Manhattan", "Newark"]
+
+
+@mock_aws
+def test_nearby_volunteers_edge_of_radius_across_cell_boundary(monkeypatch):
+    """
+    Regression: the search box used 111.32 km/degree while the distance filter uses
+    EARTH_RADIUS_KM, so a volunteer just inside the radius but across a geohash
+    boundary was never queried.
+    """
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    setup_geo_dynamodb()
+
+    # Put the search centre just south of a precision-4 cell's northern edge near Brooklyn
+    cell_height = 180.0 / 2 ** 10
+    boundary = -90.0 + round((FOOD_BANK[0] + 90.0) / cell_height) * cell_height
+    qlat = boundary - 10 / 111.32 - 1e-6
+    qlon = FOOD_BANK[1]
+
+    # Volunteer due north at 99.9% of the radius, on the other side of the boundary
+    vlat = qlat + math.degrees(0.999 * 10 / EARTH_RADIUS_KM)
+    assert vlat > boundary
+    create("Edge", round(vlat, 6), qlon)
+
+    event = {"queryStringParameters": {"lat": str(qlat), "lon": str(qlon), "radius_km": "10"}}
+    results = json.loads(nearby_volunteers(event, None)["body"])
+
+    assert [v["name"] for v in results] == ["Edge"]
+    assert 9.98 < results[0]["distance_km"] <= 10
+
+
+@mock_aws
+def test_nearby_volunteers_validation(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    setup_geo_dynamodb()
+
+    cases = [
+        ({}, "lat and lon are required"),
+        ({"lat": "abc", "lon": "1"}, "must be numbers"),
+        ({"lat": "95", "lon": "1"}, "lat must be within"),
+        ({"lat": "40", "lon": "-73", "radius_km": "500"}, "radius_km must be"),
+        ({"lat": "40", "lon": "-73", "radius_km": "-1"}, "radius_km must be"),
+        ({"lat": "89.9", "lon": "0", "radius_km": "50"}, "search area is too large"),
+    ]
+    for params, message in cases:
+        resp = nearby_volunteers({"queryStringParameters": params}, None)
+        assert resp["statusCode"] == 400
+        assert message in json.loads(resp["body"])["message"]
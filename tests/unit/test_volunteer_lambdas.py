@@ -158,3 +158,107 @@ def test_get_volunteer_missing_id(monkeypatch):
     assert resp["statusCode"] == 400
     body = json.loads(resp["body"])
     assert "id is required" in body.get("message", "")
+
+
+@mock_aws
+def test_create_volunteer_sets_version(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    table = setup_dynamodb()
+
+    event = {"body": json.dumps({"name": "Dana", "email": "dana@example.com"})}
+    volunteer_id = json.loads(create_volunteer(event, None)["body"])["id"]
+
+    stored = table.get_item(Key={"id": volunteer_id})["Item"]
+    assert stored["version"] == 1
+    assert stored["updatedAt"] == stored["createdAt"]
+
+
+@mock_aws
+def test_get_volunteer_conditional_get(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    monkeypatch.setenv("CACHE_CONTROL", "public, max-age=5, stale-while-revalidate=10")
+    setup_dynamodb()
+
+    event = {"body": json.dumps({"name": "Eve", "email": "eve@example.com", "skills": ["cooking"]})}
+    volunteer_id = json.loads(create_volunteer(event, None)["body"])["id"]
+
+    first = get_volunteer({"pathParameters": {"id": volunteer_id}}, None)
+    assert first["statusCode"] == 200
+    etag = first["headers"]["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert first["headers"]["Cache-Control"] == "public, max-age=5, stale-while-revalidate=10"
+    assert json.loads(first["body"])["version"] == 1
+
+    # Repeated load with the cached validator: 304, no body
+    second = get_volunteer(
+        {"pathParameters": {"id": volunteer_id}, "headers": {"if-none-match": etag}}, None
+    )
+    assert second["statusCode"] == 304
+    assert second["body"] == ""
+    assert second["headers"]["ETag"] == etag
+    assert second["headers"]["Cache-Control"] == "public, max-age=5, stale-while-revalidate=10"
+
+    # Weak form and lists are accepted; a stale validator is not
+    weak = get_volunteer(
+        {"pathParameters": {"id": volunteer_id}, "headers": {"If-None-Match": f'"x", W/{etag}'}}, None
+    )
+    assert weak["statusCode"] == 304
+    stale = get_volunteer(
+        {"pathParameters": {"id": volunteer_id}, "headers": {"If-None-Match": '"stale"'}}, None
+    )
+    assert stale["statusCode"] == 200
+
+
+@mock_aws
+def test_get_volunteer_etag_changes_on_write(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    table = setup_dynamodb()
+
+    table.put_item(Item={"id": "VOL1", "name": "Alice", "version": 1, "updatedAt": "2024-01-01T00:00:00+00:00"})
+    etag = get_volunteer({"pathParameters": {"id": "VOL1"}}, None)["headers"]["ETag"]
+
+    table.put_item(Item={"id": "VOL1", "name": "Alicia", "version": 2, "updatedAt": "2024-01-02T00:00:00+00:00"})
+    resp = get_volunteer({"pathParameters": {"id": "VOL1"}, "headers": {"if-none-match": etag}}, None)
+
+    assert resp["statusCode"] == 200
+    assert resp["headers"]["ETag"] != etag
+    assert json.loads(resp["body"])["name"] == "Alicia"
+
+
+@mock_aws
+def test_list_volunteers_conditional_get_saves_bytes(monkeypatch):
+    monkeypatch.setenv("VOLUNTEER_TABLE", TABLE_NAME)
+    setup_dynamodb()
+
+    for i in range(50):
+        payload = {
+            "name": f"Volunteer {i}",
+            "email": f"volunteer{i}@example.com",
+            "city": "Brooklyn",
+            "skills": ["tutoring", "organization"],
+        }
+        create_volunteer({"body": json.dumps(payload)}, None)
+
+    # Simulate a client that reloads the page 10 times, revalidating with its cached ETag
+    loads = 10
+    first = list_volunteers({}, None)
+    assert first["statusCode"] == 200
+    full_size = len(first["body"].encode())
+    etag = first["headers"]["ETag"]
+
+    cached_bytes = full_size
+    for _ in range(loads - 1):
+        resp = list_volunteers({"headers": {"if-none-match": etag}}, None)
+        assert resp["statusCode"] == 304
+        cached_bytes += len(resp["body"].encode())
+
+    uncached_bytes = full_size * loads
+    assert cached_bytes == full_size
+    assert uncached_bytes - cached_bytes == full_size * (loads - 1)
+
+    # A new volunteer invalidates the collection ETag
+    create_volunteer({"body": json.dumps({"name": "Late", "email": "late@example.com"})}, None)
+    resp = list_volunteers({"headers": {"if-none-match": etag}}, None)
+    assert resp["statusCode"] == 200
+    assert resp["headers"]["ETag"] != etag
+    assert len(json.loads(resp["body"])) == 51
@@ -0,0 +1,33 @@
+# tests/volunteer_tables.py
+# Shared Moto table setup for tests that need the geohash GSI (unit tests + benchmark).
+import boto3
+
+TABLE_NAME = "HelpingHands_Volunteers_Test"
+GEOHASH_INDEX_NAME = "geohash4-index"
+
+
+def setup_geo_dynamodb():
+    """Volunteers table with the same geohash4-index GSI as infra/template.yaml."""
+    dynamo = boto3.resource("dynamodb", region_name="us-east-1")
+    table = dynamo.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "geohash4", "AttributeType": "S"},
+            {"AttributeName": "geohash", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": GEOHASH_INDEX_NAME,
+                "KeySchema": [
+                    {"AttributeName": "geohash4", "KeyType": "HASH"},
+                    {"AttributeName": "geohash", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.meta.client.get_waiter("table_exists").wait(TableName=TABLE_NAME)
+    return table